@@ -2,8 +2,26 @@ from connector import ConnectorInterface, GeoNetworkConnector, ConnectorError
 from validator import GeoNetworkValidator
 from notifications import NotificationService, FileNotificationBackend, BatchStats, InvalidRecordDetails
 from config import ConfigLoader
+from state import StateStore
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime, timezone, timedelta
-import xml.etree.ElementTree as ET
+from lxml import etree
+
+# Validation is CPU-bound (lxml parse + XPath), so size the pool to the
+# machine rather than a fixed constant, with a sane upper bound.
+MAX_RECORD_WORKERS = min(32, os.cpu_count() or 1)
+
+# Upper bound on records submitted to the pool but not yet consumed, so
+# in-flight XML is capped regardless of how many records the stream holds.
+SUBMIT_WINDOW = MAX_RECORD_WORKERS * 2
+
+# Invalid-record notifications are flushed in batches of this size so one
+# backend call covers many records.
+NOTIFY_FLUSH_SIZE = 100
 
 
 class BatchJob:
@@ -13,85 +31,162 @@ class BatchJob:
         self.notifications = notifications
 
         self.connection_success = False
-        self.search_hits = []
+        # True only when the record stream was consumed to the end; the
+        # watermark must not advance past records that were fetched but
+        # never validated because a run aborted mid-stream.
+        self.stream_completed = False
+        self.state_store = StateStore()
         self.since = self._set_since()
         self.config_loader = ConfigLoader()
         self.base_url = self.config_loader.source_config.url
 
+        # Record links share a fixed prefix; build it once instead of
+        # re-deriving it from the base URL for every invalid record.
+        base = self.base_url.rstrip('/').removesuffix("/geonetwork/srv/api")
+        self._link_prefix = f"{base}/geonetwork/srv/eng/catalog.search#/metadata/"
+
+        # Compile the extraction XPaths once; lxml evaluates compiled XPath
+        # objects in C, so per-record lookups avoid re-parsing the path and
+        # the namespace map every time. etree.XPath wants a plain dict, not
+        # the read-only proxy the config exposes.
+        ns = dict(self.config_loader.namespaces)
+        # One parser per worker thread: lxml serializes concurrent use of a
+        # shared parser internally, which would queue the whole validation
+        # pool on a single parser lock.
+        self._thread_state = threading.local()
+        self._id_xpath = etree.XPath(
+            "mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString/text()",
+            namespaces=ns)
+        self._processor_xpath = etree.XPath(
+            ".//mdb:contact/cit:CI_Responsibility[cit:role/cit:CI_RoleCode/@codeListValue='processor']",
+            namespaces=ns)
+        self._processor_name_xpath = etree.XPath(
+            "cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:name/gco:CharacterString/text()",
+            namespaces=ns)
+        self._processor_org_xpath = etree.XPath(
+            "cit:party/cit:CI_Organisation/cit:name/gco:CharacterString/text()",
+            namespaces=ns)
+
         
     def run(self):
         start_time = datetime.now()
-        self._get_delta_records()
-        self._log_state()
-        
+        records = self._get_delta_records()
+
+        total_records = 0
         valid_count = 0
         invalid_records = []
-        
-        for record in self.search_hits:
-            is_valid, error_details = self._validate_record(record)
-            if is_valid:
-                valid_count += 1
-            else:
-                invalid_records.append(error_details)
-                self.notifications.notify_record_processor_error(error_details, "placeholder@example.com")
+        notify_buffer = []
+
+        # Fan record validation out across a bounded worker pool, feeding it
+        # straight from the paginated record stream. Futures are submitted
+        # in a sliding window rather than via executor.map, which submits
+        # eagerly and would drain the whole stream into pending futures;
+        # this caps in-flight records at SUBMIT_WINDOW. Results are consumed
+        # in submission order, keeping notifications serialized here.
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_RECORD_WORKERS) as executor:
+                records_iter = iter(records)
+                pending = deque(
+                    executor.submit(self._validate_record, record)
+                    for record in islice(records_iter, SUBMIT_WINDOW))
+                while pending:
+                    is_valid, error_details = pending.popleft().result()
+                    record = next(records_iter, None)
+                    if record is not None:
+                        pending.append(executor.submit(self._validate_record, record))
+                    total_records += 1
+                    if is_valid:
+                        valid_count += 1
+                    else:
+                        invalid_records.append(error_details)
+                        notify_buffer.append(error_details)
+                        if len(notify_buffer) >= NOTIFY_FLUSH_SIZE:
+                            self.notifications.notify_record_processor_errors(notify_buffer, "placeholder@example.com")
+                            notify_buffer = []
+            self.stream_completed = True
+            self.connection_success = True
+        except ConnectorError as e:
+            self.notifications.notify_connection_error(str(e))
+        except Exception as e:
+            # Handle unexpected errors
+            print(f"Unexpected error during search: {e}")
+            self.notifications.notify_connection_error(f"Unexpected error: {e}")
+
+        self._log_state()
+
+        if notify_buffer:
+            self.notifications.notify_record_processor_errors(notify_buffer, "placeholder@example.com")
 
         end_time = datetime.now()
-        
+
         stats = BatchStats(
-            total_records=len(self.search_hits),
+            total_records=total_records,
             valid_count=valid_count,
             invalid_count=len(invalid_records),
             start_time=start_time,
             end_time=end_time
         )
-        
+
         self.notifications.notify_batch_summary(stats, invalid_records)
+        self._advance_watermark()
 
-        
-    def _get_delta_records(self):
-        self.connection_success = self.connector.can_connect()
-        if not self.connection_success:
-            self.notifications.notify_connection_error("Failed to connect to GeoNetwork.")
-            return []
 
-        try:
-            query = self.connector.construct_query(self.since)
-            self.search_hits = self.connector.search_records(query)
-        except ConnectorError as e:
-            self.notifications.notify_connection_error(str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            print(f"Unexpected error during search: {e}")
-            self.notifications.notify_connection_error(f"Unexpected error: {e}")
-        return self.search_hits
+    def _get_delta_records(self):
+        # The liveness probe rides in the connector's first _msearch round
+        # trip, so an unreachable server surfaces as a ConnectorError from
+        # the record stream instead of costing a separate GET probe here.
+        query = self.connector.construct_query(self.since)
+        return self.connector.iter_records(query)
 
     def _set_since(self):
-        # temporary implementation - should retrieve state from database
+        # Resume from the last persisted watermark; fall back to a 30-day
+        # window on the very first run.
+        watermark = self.state_store.get_watermark()
+        if watermark is not None:
+            return watermark
         return datetime.now(timezone.utc) - timedelta(days=30)
 
+    def _advance_watermark(self):
+        # max_change_date is bumped as each page's search returns, ahead of
+        # the record fetches, so a partial run may have seen dates for
+        # records it never validated; only a fully consumed stream is safe
+        # to persist.
+        if not (self.connection_success and self.stream_completed):
+            return
+        change_date = getattr(self.connector, "max_change_date", None)
+        if not change_date:
+            return
+        try:
+            watermark = datetime.fromisoformat(change_date.replace("Z", "+00:00"))
+        except ValueError:
+            return
+        self.state_store.set_watermark(watermark)
+
     def _log_state(self):
         print(f"Connection success: {self.connection_success}")
-        print(f"Search hits: {len(self.search_hits)}")
+
+    def _thread_parser(self) -> etree.XMLParser:
+        parser = getattr(self._thread_state, "xml_parser", None)
+        if parser is None:
+            parser = etree.XMLParser(resolve_entities=False)
+            self._thread_state.xml_parser = parser
+        return parser
 
     def _validate_record(self, record) -> tuple[bool, InvalidRecordDetails | None]:
-        result = self.validator.validate(record)
+        # Parse once; the same tree is shared by validation and extraction.
+        try:
+            record_element = etree.fromstring(record.encode(), self._thread_parser())
+        except etree.XMLSyntaxError:
+            return False, InvalidRecordDetails("Unknown", "Unknown", ["XML Parse Error"], "")
+
+        result = self.validator.validate(record_element)
         if result.is_valid:
             return True, None
-        
-        # Parse record for extraction
-        try:
-            record_element = ET.fromstring(record)
-        except ET.ParseError:
-            return False, InvalidRecordDetails("Unknown", "Unknown", "Unknown", ["XML Parse Error"], "")
 
         record_id = self._extract_id(record_element)
         processor_name = self._extract_processor_name(record_element)
-        
-        base = self.base_url.rstrip('/')
-        if base.endswith("/geonetwork/srv/api"):
-            base = base.replace("/geonetwork/srv/api", "")
-        
-        record_link = f"{base}/geonetwork/srv/eng/catalog.search#/metadata/{record_id}"
+
+        record_link = self._link_prefix + record_id
 
         details = InvalidRecordDetails(
             record_id=record_id,
@@ -102,39 +197,37 @@ class BatchJob:
         return False, details
 
     def _extract_id(self, record) -> str:
-        node = record.find("mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString", self.config_loader.namespaces)
-        if node is not None and node.text:
-             return node.text
+        values = self._id_xpath(record)
+        if values and values[0]:
+            return values[0]
         return "Unknown_ID"
 
     def _extract_processor_name(self, record) -> str:
         # Look for contacts with role 'processor'
-        for contact in record.findall(".//mdb:contact/cit:CI_Responsibility", self.config_loader.namespaces):
-            role_code = contact.find("cit:role/cit:CI_RoleCode", self.config_loader.namespaces)
-            if role_code is not None and role_code.get("codeListValue") == "processor":
-                # Try to find individual name
-                name_node = contact.find("cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:name/gco:CharacterString", self.config_loader.namespaces)
-                if name_node is not None and name_node.text:
-                    return name_node.text
-                
-                # Fallback to organisation name if individual not found
-                org_node = contact.find("cit:party/cit:CI_Organisation/cit:name/gco:CharacterString", self.config_loader.namespaces)
-                if org_node is not None and org_node.text:
-                    return org_node.text
-        
-        
-        
+        for contact in self._processor_xpath(record):
+            # Try to find individual name
+            names = self._processor_name_xpath(contact)
+            if names and names[0]:
+                return names[0]
+
+            # Fallback to organisation name if individual not found
+            orgs = self._processor_org_xpath(contact)
+            if orgs and orgs[0]:
+                return orgs[0]
 
-                    
         return "Unknown Processor"
 
-        
 
 
 if __name__ == "__main__":
+    import requests
+
     config_loader = ConfigLoader("config/config_dev.toml")
-    
+
+    # One session for the whole run so every request reuses the same
+    # keep-alive connection pool.
+    session = requests.Session()
     notifications_backend = FileNotificationBackend()
     notifications = NotificationService(notifications_backend)
-    batch_job = BatchJob(GeoNetworkConnector(), notifications)
+    batch_job = BatchJob(GeoNetworkConnector(session=session), notifications)
     batch_job.run()
\ No newline at end of file
@@ -1 +1 @@
-from .config_loader import ConfigLoader, SourceConfig, NotificationsConfig
\ No newline at end of file
+from .config_loader import ConfigLoader, SourceConfig, NotificationsConfig, NAMESPACES
\ No newline at end of file
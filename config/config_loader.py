@@ -1,9 +1,48 @@
+import mmap
+import os
 import tomllib
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
 
-
-@dataclass
+# ISO 19115-3 namespace map, built once at import time. MappingProxyType
+# keeps it read-only so it can be shared safely across the whole app.
+NAMESPACES = MappingProxyType({
+    'mdb': 'http://standards.iso.org/iso/19115/-3/mdb/2.0',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+    'cat': 'http://standards.iso.org/iso/19115/-3/cat/1.0',
+    'gfc': 'http://standards.iso.org/iso/19110/gfc/1.1',
+    'cit': 'http://standards.iso.org/iso/19115/-3/cit/2.0',
+    'gcx': 'http://standards.iso.org/iso/19115/-3/gcx/1.0',
+    'gex': 'http://standards.iso.org/iso/19115/-3/gex/1.0',
+    'lan': 'http://standards.iso.org/iso/19115/-3/lan/1.0',
+    'srv': 'http://standards.iso.org/iso/19115/-3/srv/2.1',
+    'mas': 'http://standards.iso.org/iso/19115/-3/mas/1.0',
+    'mcc': 'http://standards.iso.org/iso/19115/-3/mcc/1.0',
+    'mco': 'http://standards.iso.org/iso/19115/-3/mco/1.0',
+    'mda': 'http://standards.iso.org/iso/19115/-3/mda/1.0',
+    'mds': 'http://standards.iso.org/iso/19115/-3/mds/2.0',
+    'mdt': 'http://standards.iso.org/iso/19115/-3/mdt/2.0',
+    'mex': 'http://standards.iso.org/iso/19115/-3/mex/1.0',
+    'mmi': 'http://standards.iso.org/iso/19115/-3/mmi/1.0',
+    'mpc': 'http://standards.iso.org/iso/19115/-3/mpc/1.0',
+    'mrc': 'http://standards.iso.org/iso/19115/-3/mrc/2.0',
+    'mrd': 'http://standards.iso.org/iso/19115/-3/mrd/1.0',
+    'mri': 'http://standards.iso.org/iso/19115/-3/mri/1.0',
+    'mrl': 'http://standards.iso.org/iso/19115/-3/mrl/2.0',
+    'mrs': 'http://standards.iso.org/iso/19115/-3/mrs/1.0',
+    'msr': 'http://standards.iso.org/iso/19115/-3/msr/2.0',
+    'mdq': 'http://standards.iso.org/iso/19157/-2/mdq/1.0',
+    'mac': 'http://standards.iso.org/iso/19115/-3/mac/2.0',
+    'gco': 'http://standards.iso.org/iso/19115/-3/gco/1.0',
+    'gml': 'http://www.opengis.net/gml/3.2',
+    'xlink': 'http://www.w3.org/1999/xlink',
+    'gmd': 'http://www.isotc211.org/2005/gmd'
+})
+
+
+@dataclass(frozen=True, slots=True)
 class SourceConfig:
     url: str
     search_endpoint: str
@@ -13,7 +52,7 @@ class SourceConfig:
     grdc_filter_keywords: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationsConfig:
     channel: str
     destination: List[str]
@@ -21,7 +60,7 @@ class NotificationsConfig:
     client_secret: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleConfig:
     type: str
     xpath: str
@@ -29,33 +68,33 @@ class RuleConfig:
     allowed_values: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidatorConfig:
     rules: List[RuleConfig]
 
 
+@lru_cache(maxsize=None)
+def _load_toml(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    # Keyed on (path, mtime) so an edited file is re-read while an
+    # unchanged one stays cached; mmap avoids an intermediate read buffer.
+    with open(config_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        return tomllib.loads(m[:].decode())
+
+
 class ConfigLoader:
     _instance = None
-    _initialized = False
 
     def __new__(cls, config_path: str = "config/config.toml"):
         if cls._instance is None:
-            cls._instance = super(ConfigLoader, cls).__new__(cls)
+            instance = super(ConfigLoader, cls).__new__(cls)
+            instance.config_path = config_path
+            instance._config = _load_toml(config_path, os.stat(config_path).st_mtime_ns)
+            instance.source_config = instance._load_source_config()
+            instance.notifications_config = instance._load_notifications_config()
+            instance.validator_config = instance._load_validator_config()
+            cls._instance = instance
         return cls._instance
 
-    def __init__(self, config_path: str = "config/config.toml"):
-        if not self._initialized:
-            self.config_path = config_path
-            self._config = self._load_config()
-            self.source_config = self._load_source_config()
-            self.notifications_config = self._load_notifications_config()
-            self.validator_config = self._load_validator_config()
-            self._initialized = True
-
-    def _load_config(self) -> Dict[str, Any]:
-        with open(self.config_path, "rb") as f:
-            return tomllib.load(f)
-
     def _load_source_config(self) -> SourceConfig:
         connect_section = self._config.get("source", {})
         return SourceConfig(
@@ -93,35 +132,4 @@ class ConfigLoader:
 
     @property
     def namespaces(self) -> Dict[str, str]:
-        return {
-            'mdb': 'http://standards.iso.org/iso/19115/-3/mdb/2.0',
-            'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-            'cat': 'http://standards.iso.org/iso/19115/-3/cat/1.0',
-            'gfc': 'http://standards.iso.org/iso/19110/gfc/1.1',
-            'cit': 'http://standards.iso.org/iso/19115/-3/cit/2.0',
-            'gcx': 'http://standards.iso.org/iso/19115/-3/gcx/1.0',
-            'gex': 'http://standards.iso.org/iso/19115/-3/gex/1.0',
-            'lan': 'http://standards.iso.org/iso/19115/-3/lan/1.0',
-            'srv': 'http://standards.iso.org/iso/19115/-3/srv/2.1',
-            'mas': 'http://standards.iso.org/iso/19115/-3/mas/1.0',
-            'mcc': 'http://standards.iso.org/iso/19115/-3/mcc/1.0',
-            'mco': 'http://standards.iso.org/iso/19115/-3/mco/1.0',
-            'mda': 'http://standards.iso.org/iso/19115/-3/mda/1.0',
-            'mds': 'http://standards.iso.org/iso/19115/-3/mds/2.0',
-            'mdt': 'http://standards.iso.org/iso/19115/-3/mdt/2.0',
-            'mex': 'http://standards.iso.org/iso/19115/-3/mex/1.0',
-            'mmi': 'http://standards.iso.org/iso/19115/-3/mmi/1.0',
-            'mpc': 'http://standards.iso.org/iso/19115/-3/mpc/1.0',
-            'mrc': 'http://standards.iso.org/iso/19115/-3/mrc/2.0',
-            'mrd': 'http://standards.iso.org/iso/19115/-3/mrd/1.0',
-            'mri': 'http://standards.iso.org/iso/19115/-3/mri/1.0',
-            'mrl': 'http://standards.iso.org/iso/19115/-3/mrl/2.0',
-            'mrs': 'http://standards.iso.org/iso/19115/-3/mrs/1.0',
-            'msr': 'http://standards.iso.org/iso/19115/-3/msr/2.0',
-            'mdq': 'http://standards.iso.org/iso/19157/-2/mdq/1.0',
-            'mac': 'http://standards.iso.org/iso/19115/-3/mac/2.0',
-            'gco': 'http://standards.iso.org/iso/19115/-3/gco/1.0',
-            'gml': 'http://www.opengis.net/gml/3.2',
-            'xlink': 'http://www.w3.org/1999/xlink',
-            'gmd': 'http://www.isotc211.org/2005/gmd'
-        }
\ No newline at end of file
+        return NAMESPACES
\ No newline at end of file
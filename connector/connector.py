@@ -1,8 +1,28 @@
+import random
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 from abc import ABC, abstractmethod
-import json
+import orjson
+
+# Retry policy for transient search failures: attempts and base backoff
+# (doubles each retry, with jitter).
+MAX_SEARCH_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Concurrent record fetches per page; record GETs are latency-bound, so
+# fanning them out collapses N round trips into roughly one.
+MAX_FETCH_WORKERS = 16
+
+# Entry cap on the record-body memo. Big enough to absorb duplicate
+# fetches from retries or overlapping windows, small enough that a run
+# over N records never holds all N bodies in memory.
+RECORD_CACHE_MAX = 64
 
 class ConnectorError(Exception):
     """Custom exception for Connector errors."""
@@ -26,145 +46,252 @@ from config import ConfigLoader, SourceConfig
 
 
 class GeoNetworkConnector(ConnectorInterface):
-    def __init__(self):
+    # Per-request Accept headers; passing these per call keeps the shared
+    # session immutable, which the concurrent fetch paths rely on.
+    _JSON_HEADERS = {"Accept": "application/json"}
+    _XML_HEADERS = {"Accept": "application/xml"}
+
+    def __init__(self, session: requests.Session | None = None):
         self.source_config = ConfigLoader().source_config
         self.url = self.source_config.url
         self.search_endpoint = self.source_config.search_endpoint
-        self.session = requests.Session()
+        # Reuse an injected session so the whole batch shares one keep-alive
+        # connection pool; fall back to a private session for standalone use.
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
+        # Size the connection pool to the fetch fan-out (the default pool of
+        # 10 would queue and re-handshake under 16 concurrent GETs) and let
+        # urllib3 retry gateway hiccups at the transport level.
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Endpoint URLs are fixed for the connector's lifetime; build them
+        # once instead of re-stripping per request.
+        base = self.url.rstrip('/')
+        self._test_url = base + '/' + self.source_config.test_endpoint.lstrip('/')
+        self._search_url = base + '/' + self.search_endpoint.lstrip('/')
+        self._msearch_url = self._search_url.rsplit('/', 1)[0] + '/_msearch'
+        self._record_url_prefix = base + '/' + self.source_config.get_record_endpoint.lstrip('/') + '/'
+
         self.hit_count = 0
         self.filtered_count = 0
+        self._page_hit_count = 0
+        self._last_sort = None
+        self.max_change_date = None
+        # Memo of recently fetched record bodies, keyed by uuid, so retries
+        # and overlapping windows don't re-fetch the same record. Kept as a
+        # small LRU (RECORD_CACHE_MAX entries) so it never grows with the
+        # run; the lock covers the concurrent fetch fan-out.
+        self._record_cache: OrderedDict[str, str] = OrderedDict()
+        self._record_cache_lock = threading.Lock()
 
     def can_connect(self):
         """
         Test connection to the GeoNetwork API using the site endpoint.
         """
         try:
-            url = self.url.rstrip('/') + '/' + self.source_config.test_endpoint.lstrip('/')
-            response = self.session.get(url)
+            response = self.session.get(self._test_url)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException:
             return False
 
     def search_records(self, query):
-        self.session.headers.update({
-            "Accept": "application/xml"
-        })
+        return list(self.iter_records(query))
+
+    def iter_records(self, query):
+        """
+        Stream matching records page by page using Elasticsearch search_after.
+
+        Yields XML records as each page arrives, so downstream processing can
+        start before the full result set has been fetched and peak memory is
+        bounded by one page rather than the total hit count.
+        """
+        self.hit_count = 0
+        self.filtered_count = 0
+        # Start each harvest with a fresh memo so stale bodies are not reused
+        # across runs.
+        self._record_cache.clear()
+        page_size = query.get("size", self.source_config.maxRecords)
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            # First page rides in one _msearch round trip with the liveness
+            # probe; later pages go through the plain search endpoint.
+            pending = prefetcher.submit(self._probe_and_search, query)
+            while True:
+                json_records = pending.result()
+
+                # Kick off the next page's search before fetching this page's
+                # XML, so the search round trip overlaps the record GETs.
+                # Last page is the first one that comes back short.
+                if self._page_hit_count >= page_size and self._last_sort is not None:
+                    next_query = dict(query)
+                    next_query["search_after"] = self._last_sort
+                    pending = prefetcher.submit(self._search_records_json, next_query)
+                else:
+                    next_query = None
+
+                uuids = self._get_uuids_from_records(json_records)
+                for record in self._get_records_xml(uuids):
+                    yield record
+
+                if next_query is None:
+                    break
+                query = next_query
+
 
-        json_records = self._search_records_json(query)
-        uuids = self._get_uuids_from_records(json_records)
-        xml_records = self._get_records_xml(uuids)
-        return xml_records
-        
     def get_record(self, uuid):
         # test record uuid e1331a40-cd41-4506-acfe-dc4bdeee6275
+        with self._record_cache_lock:
+            cached = self._record_cache.get(uuid)
+            if cached is not None:
+                self._record_cache.move_to_end(uuid)
+                return cached
+
         try:
-            # set accept header to application/xml
-            self.session.headers.update({
-                "Accept": "application/xml"
-            })
-            url = self.url.rstrip('/') + '/' + self.source_config.get_record_endpoint.lstrip('/') + '/' + uuid
-            response = self.session.get(url)
+            url = self._record_url_prefix + uuid
+            response = self.session.get(url, headers=self._XML_HEADERS)
             response.raise_for_status()
+            with self._record_cache_lock:
+                self._record_cache[uuid] = response.text
+                if len(self._record_cache) > RECORD_CACHE_MAX:
+                    self._record_cache.popitem(last=False)
             return response.text
         except requests.exceptions.RequestException as e:
             raise ConnectorError(f"Error getting record {uuid}: {e}") from e
 
-    def construct_query(self, since):
-        # Initialize with a basic bool query structure that matches all documents
-        query_body: Dict[str, Any] = {
-            "query": {
-                "bool": {
-                    "must": [{"match_all": {}}],
-                    "filter": []
-                }
-            },
-            "size": self.source_config.maxRecords,
-        }
+    def _post_with_retry(self, url, **kwargs):
+        """
+        POST with retries so a transient blip does not abort the whole batch.
+
+        Retries up to MAX_SEARCH_RETRIES times with exponential backoff and
+        jitter; re-raises the last failure for the caller to wrap.
+        """
+        delay = RETRY_BACKOFF_SECONDS
+        for attempt in range(MAX_SEARCH_RETRIES):
+            try:
+                response = self.session.post(url, **kwargs)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.RequestException:
+                if attempt == MAX_SEARCH_RETRIES - 1:
+                    raise
+                time.sleep(delay + random.uniform(0, delay))
+                delay *= 2
+
+    def msearch(self, queries):
+        """
+        Execute several search bodies in a single _msearch round trip.
+
+        Takes a list of query dicts and returns the per-query responses in
+        request order, so callers can coalesce a liveness probe and one or
+        more filter searches into one POST instead of N.
+        """
+        try:
+            body = b"".join(b"{}\n" + orjson.dumps(query) + b"\n" for query in queries)
+            response = self._post_with_retry(
+                self._msearch_url, data=body, headers={"Content-Type": "application/x-ndjson"})
+            return orjson.loads(response.content)['responses']
+        except requests.exceptions.RequestException as e:
+            raise ConnectorError(f"Error running msearch: {e}") from e
+
+    def _probe_and_search(self, query):
+        """
+        Run the liveness probe and the first page search as one _msearch
+        round trip, instead of a probe GET followed by a search POST.
+        """
+        probe = {"query": {"match_all": {}}, "size": 0}
+        probe_response, search_response = self.msearch([probe, query])
+        if 'error' in probe_response or 'hits' not in search_response:
+            raise ConnectorError(f"GeoNetwork probe failed: {probe_response.get('error', 'no search hits returned')}")
+        return self._ingest_hits(search_response['hits']['hits'])
 
-        # Add date range filter if 'since' is provided
+    def construct_query(self, since, search_after=None):
+        filters = []
+
+        # Delta filter: records changed or created after 'since'
         if since:
-            # Format date string
-            date_str = since.isoformat().replace("+00:00", "Z") if since.tzinfo == timezone.utc else since.isoformat()
-            
-            date_should_clauses = []
-            
-            # Add changeDate range
-            date_should_clauses.append({
-                "range": {
-                    "changeDate": {
-                        "gt": date_str
-                    }
-                }
-            })
-            
-            # Add createDate range
-            date_should_clauses.append({
-                "range": {
-                    "createDate": {
-                        "gt": date_str
-                    }
+            # Format the timestamp once; both range clauses reuse it
+            date_str = since.isoformat().replace("+00:00", "Z") if since.tzinfo is timezone.utc else since.isoformat()
+            filters.append({
+                "bool": {
+                    "should": [
+                        {"range": {"changeDate": {"gt": date_str}}},
+                        {"range": {"createDate": {"gt": date_str}}},
+                    ],
+                    "minimum_should_match": 1
                 }
             })
-            
-            # Add the date filter with minimum_should_match
-            query_body["query"]["bool"]["filter"].append({
+
+        # Match GRDC records server-side so Elasticsearch only returns
+        # relevant hits; phrase matching keeps multi-word keywords intact.
+        keywords = self.source_config.grdc_filter_keywords
+        if keywords:
+            filters.append({
                 "bool": {
-                    "should": date_should_clauses,
+                    "should": [
+                        {"multi_match": {"query": keyword, "fields": ["*"], "type": "phrase", "lenient": True}}
+                        for keyword in keywords
+                    ],
                     "minimum_should_match": 1
                 }
             })
-        
-        # filter contact for resource email for containing grdc; must specify which role they may have
-        # query_body["query"]["bool"]["filter"].append(
-        #     {
-        #         "wildcard": {
-        #             "ownerForResource.email": "*grdc*"
-        #         }
-        #     }
-        # )
-
-        # filter for contract code in purpose element; must specify the format of the contract code ? No 
-        # query_body["query"]["bool"]["filter"].append(
-        #     {
-        #         "wildcard": {
-        #             "purpose": "*grdc*"
-        #         }
-        #     }
-        # )
+
+        query_body: Dict[str, Any] = {
+            "query": {
+                "bool": {
+                    "must": [{"match_all": {}}],
+                    "filter": filters
+                }
+            },
+            "size": self.source_config.maxRecords,
+            # Deterministic sort (with _id tiebreaker) so search_after
+            # pagination sees a stable ordering across pages.
+            "sort": [{"changeDate": "asc"}, {"_id": "asc"}],
+        }
+        if search_after:
+            query_body["search_after"] = search_after
 
         return query_body
 
     def _search_records_json(self, query):
-
-        self.session.headers.update({
-            "Accept": "application/json"
-        })
-
         try:
-            url = self.url.rstrip('/') + '/' + self.search_endpoint.lstrip('/')
-            response = self.session.post(url, json=query)
-            response.raise_for_status()
+            # orjson (de)serializes large hit pages several times faster than
+            # the stdlib json used by requests' json= / .json() helpers.
+            response = self._post_with_retry(self._search_url, data=orjson.dumps(query), headers=self._JSON_HEADERS)
 
-            hits = response.json()['hits']['hits']
-            self.hit_count = len(hits)
-
-            filtered_hits = self._filter_results(hits)
-
-            return filtered_hits
+            return self._ingest_hits(orjson.loads(response.content)['hits']['hits'])
         except requests.exceptions.RequestException as e:
             raise ConnectorError(f"Error searching for {query}: {e}") from e
 
+    def _ingest_hits(self, hits):
+        """Record the pagination and watermark bookkeeping for one page."""
+        self._page_hit_count = len(hits)
+        self._last_sort = hits[-1].get('sort') if hits else None
+        self.hit_count += len(hits)
+        self.filtered_count += len(hits)
+
+        # Track the latest changeDate seen so the caller can persist it
+        # as the delta watermark for the next run.
+        for hit in hits:
+            change_date = hit.get('_source', {}).get('changeDate')
+            if change_date and (self.max_change_date is None or change_date > self.max_change_date):
+                self.max_change_date = change_date
+
+        return hits
+
     def _get_records_xml(self, uuids):
-        records = []
-        for uuid in uuids:
-            record = self.get_record(uuid)
-            records.append(record)
-        return records
+        if not uuids:
+            return []
+        # Fetch record bodies concurrently; executor.map preserves the
+        # order of the uuids.
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            return list(executor.map(self.get_record, uuids))
 
     def _get_uuids_from_records(self, json_records):
         uuids = []
@@ -172,41 +299,6 @@ class GeoNetworkConnector(ConnectorInterface):
             uuids.append(record['_source']['uuid'])
         return uuids
 
-    def _filter_results(self, results):
-        keywords = self.source_config.grdc_filter_keywords
-        filtered_results = []
-        
-        for result in results:
-            if self._containts_grdc(result, keywords) or self._is_grdc_metadata(result):
-                filtered_results.append(result)
-
-        self.filtered_count = len(filtered_results)
-
-        return filtered_results
-
-    def _containts_grdc(self, result, keywords):
-        """Check if any field in the result contains any of the keywords."""
-        for value in result.values():
-            value_str = str(value)
-            for keyword in keywords:
-                if keyword in value_str:
-                    return True
-        return False
-
-    def _is_grdc_metadata(self, result):
-        return self._is_grdc_contact(result) or self._is_grdc_contract_code(result) or self._is_grdc_owner(result)
-
-    def _is_grdc_contact(self, result):
-        # covered by _containts_grdc
-        pass
-
-    def _is_grdc_contract_code(self, result):
-        pass
-
-    def _is_grdc_owner(self, result):
-        # covered by _containts_grdc
-        pass
-
 
 # if __name__ == "__main__":
     # test search
@@ -2,11 +2,16 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from typing import Optional
 import os
+import re
 import datetime
 from config import NotificationsConfig, ConfigLoader
 
+# Matches every character that is not filename-safe; compiled once so
+# subject sanitization is a single C-level substitution.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9]')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class NotificationMessage:
     subject: str
     content: str
@@ -14,7 +19,7 @@ class NotificationMessage:
     recipient: Optional[str] = None  # Optional recipient override
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InvalidRecordDetails:
     record_id: str
     processor_name: str
@@ -22,7 +27,7 @@ class InvalidRecordDetails:
     record_link: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BatchStats:
     total_records: int
     valid_count: int
@@ -45,17 +50,21 @@ class FileNotificationBackend(NotificationBackend):
     def send(self, message: NotificationMessage, config: NotificationsConfig):
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         # Sanitize subject for filename
-        safe_subject = "".join([c if c.isalnum() else "_" for c in message.subject])
+        safe_subject = _UNSAFE_FILENAME_CHARS.sub("_", message.subject)
         filename = f"{timestamp}_{safe_subject}.txt"
         filepath = os.path.join(self.output_dir, filename)
 
+        # Build the whole payload first so the file is written in one call
+        # instead of six small writes.
+        payload = (
+            f"Subject: {message.subject}\n"
+            f"Channel: {message.channel or config.channel}\n"
+            f"Destination: {message.recipient or config.destination}\n"
+            + "-" * 20 + "\n"
+            + message.content + "\n"
+        )
         with open(filepath, "w") as f:
-            f.write(f"Subject: {message.subject}\n")
-            f.write(f"Channel: {message.channel or config.channel}\n")
-            f.write(f"Destination: {message.recipient or config.destination}\n")
-            f.write("-" * 20 + "\n")
-            f.write(message.content)
-            f.write("\n")
+            f.write(payload)
 
 
 class EmailNotificationMicrosoftBackend(NotificationBackend):
@@ -108,25 +117,30 @@ class NotificationService:
         self.backend.send(msg, self.config)
 
     def notify_batch_summary(self, stats: BatchStats, invalid_records: list[InvalidRecordDetails]):
-        content = f"Batch Summary:\n"
-        content += f"Total Records Processed: {stats.total_records}\n"
-        content += f"Valid Records: {stats.valid_count}\n"
-        content += f"Invalid Records: {stats.invalid_count}\n"
-        content += f"Duration: {stats.end_time - stats.start_time}\n"
-        
+        # Accumulate parts and join once; repeated += reallocates the whole
+        # string per append, which gets quadratic on large invalid lists.
+        parts = [
+            "Batch Summary:\n",
+            f"Total Records Processed: {stats.total_records}\n",
+            f"Valid Records: {stats.valid_count}\n",
+            f"Invalid Records: {stats.invalid_count}\n",
+            f"Duration: {stats.end_time - stats.start_time}\n",
+        ]
+
         if invalid_records:
-            content += "\nInvalid Records Details:\n"
-            content += "-" * 20 + "\n"
+            parts.append("\nInvalid Records Details:\n")
+            parts.append("-" * 20 + "\n")
             for record in invalid_records:
-                content += f"Record ID: {record.record_id}\n"
-                content += f"Processor: {record.processor_name}\n"
-                content += f"Link: {record.record_link}\n"
-                content += f"Errors:\n"
-                for error in record.errors:
-                    content += f"  - {error}\n"
-                content += "-" * 10 + "\n"
+                parts.append(f"Record ID: {record.record_id}\n")
+                parts.append(f"Processor: {record.processor_name}\n")
+                parts.append(f"Link: {record.record_link}\n")
+                parts.append("Errors:\n")
+                parts.extend(f"  - {error}\n" for error in record.errors)
+                parts.append("-" * 10 + "\n")
         else:
-            content += "\nNo invalid records found.\n"
+            parts.append("\nNo invalid records found.\n")
+
+        content = "".join(parts)
 
         msg = NotificationMessage(
             subject=f"Batch Process Summary - {datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -134,15 +148,41 @@ class NotificationService:
         )
         self.backend.send(msg, self.config)
 
+    def notify_record_processor_errors(self, records: list[InvalidRecordDetails], recipient_email: str):
+        """Send one notification covering a batch of invalid records, instead
+        of one backend call (file write / email) per record."""
+        if not records:
+            return
+
+        parts = ["The following metadata records have failed validation:\n\n"]
+        for record in records:
+            parts.append(f"Record ID: {record.record_id}\n")
+            parts.append(f"Processor: {record.processor_name}\n")
+            parts.append(f"Link: {record.record_link}\n")
+            parts.append("Errors:\n")
+            parts.extend(f" - {error}\n" for error in record.errors)
+            parts.append("-" * 10 + "\n")
+        parts.append("\nPlease correct these issues in Metashare.\n")
+        content = "".join(parts)
+
+        msg = NotificationMessage(
+            subject=f"Action Required: {len(records)} Invalid Metadata Record(s)",
+            content=content,
+            recipient=recipient_email
+        )
+        self.backend.send(msg, self.config)
+
     def notify_record_processor_error(self, record: InvalidRecordDetails, recipient_email: str):
-        content = f"Dear {record.processor_name},\n\n"
-        content += f"The following metadata record has failed validation:\n"
-        content += f"Record ID: {record.record_id}\n"
-        content += f"Link: {record.record_link}\n"
-        content += f"\nErrors:\n"
-        for error in record.errors:
-            content += f" - {error}\n"
-        content += "\nPlease correct these issues in Metashare.\n"
+        parts = [
+            f"Dear {record.processor_name},\n\n",
+            "The following metadata record has failed validation:\n",
+            f"Record ID: {record.record_id}\n",
+            f"Link: {record.record_link}\n",
+            "\nErrors:\n",
+        ]
+        parts.extend(f" - {error}\n" for error in record.errors)
+        parts.append("\nPlease correct these issues in Metashare.\n")
+        content = "".join(parts)
 
         msg = NotificationMessage(
             subject=f"Action Required: Invalid Metadata Record {record.record_id}",
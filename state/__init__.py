@@ -0,0 +1 @@
+from .state_store import StateStore
\ No newline at end of file
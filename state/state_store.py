@@ -0,0 +1,43 @@
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Optional
+
+
+class StateStore:
+    """Small SQLite-backed key/value store for batch state.
+
+    Persists the high-watermark (latest changeDate seen) between runs so
+    each batch only asks GeoNetwork for records changed since the last
+    successful run instead of re-scanning a fixed window.
+    """
+
+    WATERMARK_KEY = "since_watermark"
+
+    def __init__(self, db_path: str = "state/batch_state.db"):
+        self.db_path = db_path
+        self._init_db()
+
+    # sqlite3's context manager only wraps a transaction, so each method
+    # pairs it with closing() to release the connection as well.
+
+    def _init_db(self):
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS state (k TEXT PRIMARY KEY, v TEXT)")
+
+    def get_watermark(self) -> Optional[datetime]:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT v FROM state WHERE k = ?", (self.WATERMARK_KEY,)
+            ).fetchone()
+        if row:
+            return datetime.fromisoformat(row[0])
+        return None
+
+    def set_watermark(self, watermark: datetime):
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "INSERT INTO state (k, v) VALUES (?, ?) "
+                "ON CONFLICT(k) DO UPDATE SET v = excluded.v",
+                (self.WATERMARK_KEY, watermark.isoformat())
+            )
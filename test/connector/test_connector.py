@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+import orjson
 import requests
 from connector import GeoNetworkConnector, ConnectorError
 
@@ -59,9 +60,10 @@ class TestGeoNetworkConnector(unittest.TestCase):
         result = self.connector.get_record(uuid)
         
         self.assertEqual(result, expected_xml)
-        self.connector.session.get.assert_called_with("http://example.com/geonetwork/srv/api/records/test-uuid-123")
-        # Check if Accept header was updated
-        self.connector.session.headers.update.assert_called_with({"Accept": "application/xml"})
+        # Accept header is passed per request instead of mutating the session
+        self.connector.session.get.assert_called_with(
+            "http://example.com/geonetwork/srv/api/records/test-uuid-123",
+            headers={"Accept": "application/xml"})
 
     def test_get_record_failure(self):
         """Test failure when retrieving a record."""
@@ -76,14 +78,15 @@ class TestGeoNetworkConnector(unittest.TestCase):
         
         self.assertIn("Error getting record invalid-uuid", str(context.exception))
 
-    @patch('connector.connector.GeoNetworkConnector._search_records_json')
+    @patch('connector.connector.GeoNetworkConnector._probe_and_search')
     @patch('connector.connector.GeoNetworkConnector._get_records_xml')
-    def test_search_records(self, mock_get_xml, mock_search_json):
+    def test_search_records(self, mock_get_xml, mock_probe_search):
         """Test the high-level search_records flow."""
         query = {"some": "query"}
-        
-        # Setup mock returns
-        mock_search_json.return_value = [
+
+        # Setup mock returns; the first page arrives via the combined
+        # probe-and-search round trip
+        mock_probe_search.return_value = [
             {'_source': {'uuid': 'uuid1'}},
             {'_source': {'uuid': 'uuid2'}}
         ]
@@ -95,11 +98,74 @@ class TestGeoNetworkConnector(unittest.TestCase):
         # Verify
         self.assertEqual(len(results), 2)
         self.assertEqual(results, ["<xml>1</xml>", "<xml>2</xml>"])
-        
+
         # Verify calls
-        mock_search_json.assert_called_with(query)
+        mock_probe_search.assert_called_with(query)
         mock_get_xml.assert_called_with(['uuid1', 'uuid2'])
-        self.connector.session.headers.update.assert_called_with({"Accept": "application/xml"})
+
+    @staticmethod
+    def _hit(uuid, sort):
+        return {'_source': {'uuid': uuid, 'changeDate': f'2024-01-0{sort}'}, 'sort': [sort]}
+
+    def _mock_record_gets(self):
+        """Serve each record GET with XML derived from the requested uuid."""
+        def fake_get(url, headers=None):
+            response = MagicMock()
+            response.raise_for_status.return_value = None
+            response.text = f"<xml>{url.rsplit('/', 1)[1]}</xml>"
+            return response
+        self.connector.session.get.side_effect = fake_get
+
+    def test_iter_records_multi_page(self):
+        """search_after is carried between pages and a short page ends the loop."""
+        page1 = [self._hit('u1', 1), self._hit('u2', 2)]
+        page2 = [self._hit('u3', 3)]
+        posts = []
+
+        def fake_post(url, data=None, headers=None):
+            posts.append((url, data))
+            response = MagicMock()
+            if url.endswith('/_msearch'):
+                body = {'responses': [{'hits': {'hits': []}}, {'hits': {'hits': page1}}]}
+            else:
+                body = {'hits': {'hits': page2}}
+            response.content = orjson.dumps(body)
+            return response
+
+        self.connector._post_with_retry = MagicMock(side_effect=fake_post)
+        self._mock_record_gets()
+
+        results = list(self.connector.iter_records({"some": "query", "size": 2}))
+
+        self.assertEqual(results, ["<xml>u1</xml>", "<xml>u2</xml>", "<xml>u3</xml>"])
+
+        # First page rides the combined probe round trip; the full second
+        # page triggers exactly one follow-up search carrying search_after
+        self.assertEqual(len(posts), 2)
+        self.assertTrue(posts[0][0].endswith('/_msearch'))
+        second_query = orjson.loads(posts[1][1])
+        self.assertEqual(second_query['search_after'], [2])
+        self.assertEqual(self.connector.hit_count, 3)
+
+    def test_iter_records_fetch_failure(self):
+        """A failing record GET mid-page propagates as ConnectorError."""
+        page = [self._hit('u1', 1)]
+
+        def fake_post(url, data=None, headers=None):
+            response = MagicMock()
+            response.content = orjson.dumps(
+                {'responses': [{'hits': {'hits': []}}, {'hits': {'hits': page}}]})
+            return response
+
+        self.connector._post_with_retry = MagicMock(side_effect=fake_post)
+        failing_response = MagicMock()
+        failing_response.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error")
+        self.connector.session.get.return_value = failing_response
+
+        with self.assertRaises(ConnectorError) as context:
+            list(self.connector.iter_records({"some": "query", "size": 2}))
+
+        self.assertIn("Error getting record u1", str(context.exception))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,22 +1,52 @@
+import gzip
+import logging
 import os
-import copy
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import repeat
+from functools import lru_cache
 from typing import List, Optional, Dict
 import sys
 
 # Add project root to sys.path to allow importing config
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
-from config import ConfigLoader
+from config import NAMESPACES
 
-# Initialize ConfigLoader to get namespaces
-config_loader = ConfigLoader()
-NAMESPACES = config_loader.namespaces
+# No ET.register_namespace loop: lxml preserves the prefixes of the
+# parsed base document, so registration (a global mutation on every
+# import) is unnecessary. Importing the shared NAMESPACES constant also
+# avoids constructing a ConfigLoader as an import side effect.
 
-# Register namespaces for parsing/writing
-for prefix, uri in NAMESPACES.items():
-    ET.register_namespace(prefix, uri)
+log = logging.getLogger(__name__)
+
+# etree.XPath wants a plain dict, not the read-only proxy
+_XPATH_NS = dict(NAMESPACES)
+
+
+@lru_cache(maxsize=None)
+def _compile_xpath(expr: str) -> ET.XPath:
+    """Compile an XPath expression once and reuse it across all test cases."""
+    return ET.XPath(expr, namespaces=_XPATH_NS)
+
+
+# Fixed expressions used by the custom PI actions, compiled at import time.
+# The role check is folded into the predicate so libxml2 filters parties
+# down to principal investigators in C instead of a per-party Python check.
+_XP_PI_PARTIES = ET.XPath(
+    ".//cit:citedResponsibleParty"
+    "[.//cit:role/cit:CI_RoleCode/@codeListValue='principalInvestigator']",
+    namespaces=_XPATH_NS)
+_XP_PI_EMAIL = ET.XPath(".//cit:electronicMailAddress/gco:CharacterString", namespaces=_XPATH_NS)
+_XP_ONLINE_RES = ET.XPath(".//cit:onlineResource/cit:CI_OnlineResource", namespaces=_XPATH_NS)
+_XP_RES_NAME = ET.XPath("cit:name/gco:CharacterString", namespaces=_XPATH_NS)
+_XP_RES_LINKAGE = ET.XPath("cit:linkage/gco:CharacterString", namespaces=_XPATH_NS)
+_XP_PI_NAME = ET.XPath(".//cit:individual/cit:CI_Individual/cit:name", namespaces=_XPATH_NS)
+
+# One parser per process, reused for every case, so per-case parses skip
+# parser construction and reuse libxml2's warm dictionaries.
+_PARSER = ET.XMLParser()
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 VALID_XML_PATH = os.path.join(BASE_DIR, 'valid.xml')
@@ -32,7 +62,7 @@ class ActionType(Enum):
     CUSTOM_REMOVE_PI = auto()
     CUSTOM_PI_MISSING_NAME = auto()
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestCase:
     name: str
     action: ActionType
@@ -46,141 +76,160 @@ class XMLTestGenerator:
         self.base_xml_path = base_xml_path
         if not os.path.exists(self.base_xml_path):
             raise FileNotFoundError(f"Base XML file not found at {self.base_xml_path}")
+        # Parse the base document once and keep its serialized bytes; each
+        # worker re-hydrates a clean tree from them per test case.
+        self._base_bytes = ET.tostring(ET.parse(self.base_xml_path))
+
+    def generate(self, cases: List[TestCase], output_dir: str, prefix: str = "",
+                 compress: bool = False) -> int:
+        """Generate the given cases into output_dir; returns the number
+        of cases successfully written."""
+        os.makedirs(output_dir, exist_ok=True)
+
+        log.debug("Generating %d test cases in %s...", len(cases), output_dir)
+
+        # The directory and prefix parts are invariant; build them once and
+        # concatenate per case instead of joining and formatting each time.
+        suffix = '.xml.gz' if compress else '.xml'
+        path_prefix = output_dir + os.sep + (f"{prefix}_" if prefix else "")
+        output_paths = [path_prefix + case.name + suffix for case in cases]
+
+        # Each case is an independent parse -> mutate -> serialize, and
+        # lxml tree work holds the GIL, so spread the cases across
+        # processes rather than threads. Workers return the serialized
+        # bytes; persistence happens in one pass below.
+        payloads = []
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(
+                _render_case, repeat(self._base_bytes), cases, chunksize=4)
+            for case, output_path, (data, error) in zip(cases, output_paths, results):
+                if error is None:
+                    payloads.append((output_path, data))
+                    log.debug("Generated: %s", case.name)
+                else:
+                    log.error("generating %s: %s", case.name, error)
+
+        # Write everything in one tight loop so each file is a single
+        # open/write/close instead of interleaving I/O with tree work.
+        # compress=True writes .xml.gz at the fastest level for bulk runs
+        # whose outputs are consumed once; lxml's etree.parse reads gzip
+        # transparently.
+        for output_path, data in payloads:
+            if compress:
+                with gzip.open(output_path, 'wb', compresslevel=1) as f:
+                    f.write(data)
+            else:
+                with open(output_path, 'wb', buffering=1 << 20) as f:
+                    f.write(data)
+
+        return len(payloads)
+
+
+def _render_case(base_bytes: bytes, case: TestCase) -> tuple[Optional[bytes], Optional[str]]:
+    """Build one test case in a worker process.
+
+    Parses a clean tree from the shared base bytes, applies the case's
+    mutation and serializes the result. Returns (data, error) instead of
+    raising so one bad case doesn't tear down the whole pool.
+    """
+    try:
+        root = ET.fromstring(base_bytes, _PARSER)
+        _apply_action(root, case)
+        return ET.tostring(root, encoding='UTF-8', xml_declaration=True), None
+    except Exception as e:
+        return None, str(e)
+
+def _apply_action(root: ET.Element, case: TestCase):
+    handler = _ACTION_DISPATCH.get(case.action)
+    if handler is None:
+        raise ValueError(f"Unknown action type: {case.action}")
+    handler(root, case)
 
-    def generate(self, cases: List[TestCase], output_dir: str, prefix: str = ""):
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        print(f"Generating {len(cases)} test cases in {output_dir}...")
-
-        for case in cases:
-            # Reload tree to ensure clean state for each test case
-            tree = ET.parse(self.base_xml_path)
-            root = tree.getroot()
-            
-            print(f"Generating: {case.name}")
-            
-            try:
-                self._apply_action(root, case)
-                
-                filename = f"{prefix}_{case.name}.xml" if prefix else f"{case.name}.xml"
-                output_path = os.path.join(output_dir, filename)
-                tree.write(output_path, encoding='UTF-8', xml_declaration=True)
-                
-            except Exception as e:
-                print(f"  ERROR generating {case.name}: {e}")
-
-    def _apply_action(self, root: ET.Element, case: TestCase):
-        if case.action == ActionType.SET_TEXT:
-            self._set_text(root, case.xpath, case.value)
-        elif case.action == ActionType.SET_ATTRIBUTE:
-            self._set_attribute(root, case.xpath, case.attribute, case.value)
-        elif case.action == ActionType.REMOVE_ELEMENT:
-            self._remove_element(root, case.xpath)
-        elif case.action == ActionType.CUSTOM_PI_EMAIL:
-            self._custom_pi_email(root, case.value)
-        elif case.action == ActionType.CUSTOM_PI_ORCID:
-            self._custom_pi_orcid(root, case.value)
-        elif case.action == ActionType.CUSTOM_REMOVE_PI:
-            self._custom_remove_pi(root)
-        elif case.action == ActionType.CUSTOM_PI_MISSING_NAME:
-            self._custom_pi_missing_name(root)
-        else:
-            raise ValueError(f"Unknown action type: {case.action}")
-
-    def _set_text(self, root: ET.Element, xpath: str, value: str):
-        element = root.find(xpath, NAMESPACES)
-        if element is not None:
-            element.text = value
-        else:
-            print(f"  WARNING: Element not found at {xpath}")
-
-    def _set_attribute(self, root: ET.Element, xpath: str, attribute: str, value: str):
-        element = root.find(xpath, NAMESPACES)
-        if element is not None:
-            element.set(attribute, value)
-        else:
-            print(f"  WARNING: Element not found at {xpath}")
-
-    def _remove_element(self, root: ET.Element, xpath: str):
-        # Find parent and remove child
-        # Strategy: find all potential parents based on the xpath structure
-        if '/' not in xpath:
-            return # Cannot remove root or invalid path
-            
-        parent_xpath, child_tag = xpath.rsplit('/', 1)
-        
-        # Handle namespace in child_tag
-        if ':' in child_tag:
-            prefix, tag = child_tag.split(':')
-            expanded_tag = f"{{{NAMESPACES[prefix]}}}{tag}"
-        else:
-            expanded_tag = child_tag
-
-        parents = root.findall(parent_xpath, NAMESPACES)
-        for parent in parents:
-            to_remove = [child for child in parent if child.tag == expanded_tag]
-            for child in to_remove:
-                parent.remove(child)
-
-    def _custom_pi_email(self, root: ET.Element, value: str):
-        parties = root.findall(".//cit:citedResponsibleParty", NAMESPACES)
-        for party in parties:
-            role = party.find(".//cit:role/cit:CI_RoleCode", NAMESPACES)
-            if role is not None and role.get('codeListValue') == 'principalInvestigator':
-                email = party.find(".//cit:electronicMailAddress/gco:CharacterString", NAMESPACES)
-                if email is not None:
-                    email.text = value
-
-    def _custom_pi_orcid(self, root: ET.Element, value: str):
-        parties = root.findall(".//cit:citedResponsibleParty", NAMESPACES)
-        for party in parties:
-            role = party.find(".//cit:role/cit:CI_RoleCode", NAMESPACES)
-            if role is not None and role.get('codeListValue') == 'principalInvestigator':
-                online_res = party.findall(".//cit:onlineResource/cit:CI_OnlineResource", NAMESPACES)
-                for res in online_res:
-                    name = res.find("cit:name/gco:CharacterString", NAMESPACES)
-                    if name is not None and name.text in ('Orcid', 'Orchid'):
-                        linkage = res.find("cit:linkage/gco:CharacterString", NAMESPACES)
-                        if linkage is not None:
-                            linkage.text = value
-
-    def _custom_remove_pi(self, root: ET.Element):
-        citations = root.findall(".//cit:CI_Citation", NAMESPACES)
-        for citation in citations:
-            to_remove = []
-            for child in citation:
-                if child.tag == f"{{{NAMESPACES['cit']}}}citedResponsibleParty":
-                    role = child.find(".//cit:role/cit:CI_RoleCode", NAMESPACES)
-                    if role is not None and role.get('codeListValue') == 'principalInvestigator':
-                        to_remove.append(child)
-            for child in to_remove:
-                citation.remove(child)
-
-    def _custom_pi_missing_name(self, root: ET.Element):
-        parties = root.findall(".//cit:citedResponsibleParty", NAMESPACES)
-        for party in parties:
-            role = party.find(".//cit:role/cit:CI_RoleCode", NAMESPACES)
-            if role is not None and role.get('codeListValue') == 'principalInvestigator':
-                name_el = party.find(".//cit:individual/cit:CI_Individual/cit:name", NAMESPACES)
-                if name_el is not None:
-                    # Remove all children (like gco:CharacterString) to simulate missing name content
-                    for child in list(name_el):
-                        name_el.remove(child)
-
-def get_invalid_test_cases() -> List[TestCase]:
-    return [
+def _set_text(root: ET.Element, xpath: str, value: str):
+    matches = _compile_xpath(xpath)(root)
+    if matches:
+        matches[0].text = value
+    else:
+        log.warning("Element not found at %s", xpath)
+
+def _set_attribute(root: ET.Element, xpath: str, attribute: str, value: str):
+    matches = _compile_xpath(xpath)(root)
+    if matches:
+        matches[0].set(attribute, value)
+    else:
+        log.warning("Element not found at %s", xpath)
+
+def _remove_element(root: ET.Element, xpath: str):
+    if '/' not in xpath:
+        return # Cannot remove root or invalid path
+
+    # Match the targets directly and detach each from its parent; lxml
+    # keeps parent pointers, so no split-parent-and-rescan second pass.
+    for node in _compile_xpath(xpath)(root):
+        node.getparent().remove(node)
+
+def _custom_pi_email(root: ET.Element, value: str):
+    # One invalid PI is enough to make the document invalid, so stop at
+    # the first mutation instead of scanning the remaining parties.
+    for party in _XP_PI_PARTIES(root):
+        emails = _XP_PI_EMAIL(party)
+        if emails:
+            emails[0].text = value
+            return
+
+def _custom_pi_orcid(root: ET.Element, value: str):
+    for party in _XP_PI_PARTIES(root):
+        for res in _XP_ONLINE_RES(party):
+            names = _XP_RES_NAME(res)
+            if names and names[0].text in ('Orcid', 'Orchid'):
+                linkages = _XP_RES_LINKAGE(res)
+                if linkages:
+                    linkages[0].text = value
+                    return
+
+def _custom_remove_pi(root: ET.Element):
+    for party in _XP_PI_PARTIES(root):
+        party.getparent().remove(party)
+
+def _custom_pi_missing_name(root: ET.Element):
+    for party in _XP_PI_PARTIES(root):
+        names = _XP_PI_NAME(party)
+        if names:
+            # Drop all children (like gco:CharacterString) in one slice
+            # assignment to simulate missing name content
+            names[0][:] = []
+
+# One dict lookup routes a case to its handler instead of walking an
+# if/elif chain per case.
+_ACTION_DISPATCH = {
+    ActionType.SET_TEXT: lambda root, case: _set_text(root, case.xpath, case.value),
+    ActionType.SET_ATTRIBUTE: lambda root, case: _set_attribute(root, case.xpath, case.attribute, case.value),
+    ActionType.REMOVE_ELEMENT: lambda root, case: _remove_element(root, case.xpath),
+    ActionType.CUSTOM_PI_EMAIL: lambda root, case: _custom_pi_email(root, case.value),
+    ActionType.CUSTOM_PI_ORCID: lambda root, case: _custom_pi_orcid(root, case.value),
+    ActionType.CUSTOM_REMOVE_PI: lambda root, case: _custom_remove_pi(root),
+    ActionType.CUSTOM_PI_MISSING_NAME: lambda root, case: _custom_pi_missing_name(root),
+}
+
+# Strips the characters dropped from license slugs and maps spaces to
+# underscores in one table-driven pass.
+_SLUG_TABLE = str.maketrans({' ': '_', '(': None, ')': None, '.': None})
+
+
+@lru_cache(maxsize=None)
+def get_invalid_test_cases() -> tuple[TestCase, ...]:
+    return (
         TestCase(
             name="title_empty",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:citation/cit:CI_Citation/cit:title/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:citation/cit:CI_Citation/cit:title/gco:CharacterString",
             value="",
             description="Title must be non-empty string"
         ),
         TestCase(
             name="resource_type_invalid",
             action=ActionType.SET_ATTRIBUTE,
-            xpath=".//mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode",
+            xpath="./mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode",
             attribute="codeListValue",
             value="Mosaic",
             description="Resource type cannot be Mosaic"
@@ -188,84 +237,84 @@ def get_invalid_test_cases() -> List[TestCase]:
         TestCase(
             name="abstract_empty",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:abstract/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:abstract/gco:CharacterString",
             value="",
             description="Abstract must be non-empty string"
         ),
         TestCase(
             name="purpose_invalid_format",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:purpose/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:purpose/gco:CharacterString",
             value="InvalidPurpose",
             description="Purpose must be 'GRDC contract code, project title'"
         ),
         TestCase(
             name="contract_code_invalid",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:purpose/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:purpose/gco:CharacterString",
             value="DAV1707-001-BLX1, title",
             description="Contract code is in format {A-Z}*3{0-9}*4-{0-9}*3-{A-Z}*3"
         ),
         TestCase(
             name="begin_date_empty",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:beginPosition",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:beginPosition",
             value="",
             description="Begin date non-empty"
         ),
         TestCase(
             name="begin_date_invalid_format",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:beginPosition",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:beginPosition",
             value="2022/06/15",
             description="Begin date dd-MM-YYYY format"
         ),
         TestCase(
             name="end_date_empty",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:endPosition",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:endPosition",
             value="",
             description="End date non-empty"
         ),
         TestCase(
             name="end_date_invalid_format",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:endPosition",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:endPosition",
             value="invalid",
             description="End date valid format"
         ),
         TestCase(
             name="spatial_ref_invalid",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:referenceSystemInfo/mrs:MD_ReferenceSystem/mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString",
+            xpath="./mdb:referenceSystemInfo/mrs:MD_ReferenceSystem/mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString",
             value="EPSG:9999",
             description="Reference system must be WGS84 or Google mercator"
         ),
         TestCase(
             name="west_longitude_non_float",
             action=ActionType.SET_TEXT,
-            xpath=".//gex:westBoundLongitude/gco:Decimal",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:geographicElement/gex:EX_GeographicBoundingBox/gex:westBoundLongitude/gco:Decimal",
             value="abc",
             description="WestBoundLongitude must be float"
         ),
         TestCase(
             name="east_longitude_non_float",
             action=ActionType.SET_TEXT,
-            xpath=".//gex:eastBoundLongitude/gco:Decimal",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:geographicElement/gex:EX_GeographicBoundingBox/gex:eastBoundLongitude/gco:Decimal",
             value="abc",
             description="EastBoundLongitude must be float"
         ),
         TestCase(
             name="south_latitude_non_float",
             action=ActionType.SET_TEXT,
-            xpath=".//gex:southBoundLatitude/gco:Decimal",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:geographicElement/gex:EX_GeographicBoundingBox/gex:southBoundLatitude/gco:Decimal",
             value="abc",
             description="SouthBoundLatitude must be float"
         ),
         TestCase(
             name="north_latitude_non_float",
             action=ActionType.SET_TEXT,
-            xpath=".//gex:northBoundLatitude/gco:Decimal",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:extent/gex:EX_Extent/gex:geographicElement/gex:EX_GeographicBoundingBox/gex:northBoundLatitude/gco:Decimal",
             value="abc",
             description="NorthBoundLatitude must be float"
         ),
@@ -284,7 +333,7 @@ def get_invalid_test_cases() -> List[TestCase]:
         TestCase(
             name="no_valid_identifier",
             action=ActionType.REMOVE_ELEMENT,
-            xpath=".//mdb:distributionInfo/mrd:MD_Distribution/mrd:transferOptions/mrd:MD_DigitalTransferOptions/mrd:onLine/cit:CI_OnlineResource",
+            xpath="./mdb:distributionInfo/mrd:MD_Distribution/mrd:transferOptions/mrd:MD_DigitalTransferOptions/mrd:onLine/cit:CI_OnlineResource",
             description="Need one of Valid DOI, Handle, URL"
         ),
         TestCase(
@@ -300,7 +349,7 @@ def get_invalid_test_cases() -> List[TestCase]:
         TestCase(
             name="classification_invalid",
             action=ActionType.SET_ATTRIBUTE,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_SecurityConstraints/mco:classification/mco:MD_ClassificationCode",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_SecurityConstraints/mco:classification/mco:MD_ClassificationCode",
             attribute="codeListValue",
             value="invalid",
             description="Classification must be valid"
@@ -308,13 +357,15 @@ def get_invalid_test_cases() -> List[TestCase]:
         TestCase(
             name="license_invalid",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_LegalConstraints/mco:reference/cit:CI_Citation/cit:title/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_LegalConstraints/mco:reference/cit:CI_Citation/cit:title/gco:CharacterString",
             value="Invalid License",
             description="License Type must be one of allowed list"
         )
-    ]
+    )
 
-def get_valid_test_cases() -> List[TestCase]:
+
+@lru_cache(maxsize=None)
+def get_valid_test_cases() -> tuple[TestCase, ...]:
     cases = []
     
     # Resource Types
@@ -322,7 +373,7 @@ def get_valid_test_cases() -> List[TestCase]:
         cases.append(TestCase(
             name=f"resource_type_{res_type}",
             action=ActionType.SET_ATTRIBUTE,
-            xpath=".//mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode",
+            xpath="./mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode",
             attribute="codeListValue",
             value=res_type,
             description=f"Valid resource type: {res_type}"
@@ -335,11 +386,11 @@ def get_valid_test_cases() -> List[TestCase]:
         'restricted', 'confidential', 'protected', 'secret', 'top secret'
     ]
     for cls in classifications:
-        safe_name = cls.replace(' ', '_')
+        safe_name = cls.translate(_SLUG_TABLE)
         cases.append(TestCase(
             name=f"classification_{safe_name}",
             action=ActionType.SET_ATTRIBUTE,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_SecurityConstraints/mco:classification/mco:MD_ClassificationCode",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_SecurityConstraints/mco:classification/mco:MD_ClassificationCode",
             attribute="codeListValue",
             value=cls,
             description=f"Valid classification: {cls}"
@@ -349,7 +400,7 @@ def get_valid_test_cases() -> List[TestCase]:
     cases.append(TestCase(
         name="spatial_ref_google_mercator",
         action=ActionType.SET_TEXT,
-        xpath=".//mdb:referenceSystemInfo/mrs:MD_ReferenceSystem/mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString",
+        xpath="./mdb:referenceSystemInfo/mrs:MD_ReferenceSystem/mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString",
         value="Google mercator (EPSG:3857)",
         description="Valid spatial ref: Google mercator"
     ))
@@ -361,31 +412,35 @@ def get_valid_test_cases() -> List[TestCase]:
         'Creative commons attribution 4.0 (CC-BY)'
     ]
     for lic in licenses:
-        safe_name = lic.replace(' ', '_').replace('(', '').replace(')', '').replace('.', '')
+        safe_name = lic.translate(_SLUG_TABLE)
         cases.append(TestCase(
             name=f"license_{safe_name}",
             action=ActionType.SET_TEXT,
-            xpath=".//mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_LegalConstraints/mco:reference/cit:CI_Citation/cit:title/gco:CharacterString",
+            xpath="./mdb:identificationInfo/mri:MD_DataIdentification/mri:resourceConstraints/mco:MD_LegalConstraints/mco:reference/cit:CI_Citation/cit:title/gco:CharacterString",
             value=lic,
             description=f"Valid license: {lic}"
         ))
-        
-    return cases
+
+    return tuple(cases)
 
 def main():
+    # Warnings and errors still reach the console; per-case progress only
+    # appears when the level is dropped to DEBUG.
+    logging.basicConfig(level=logging.WARNING)
     try:
         generator = XMLTestGenerator(VALID_XML_PATH)
-        
+
         # Generate Invalid Cases
         invalid_cases = get_invalid_test_cases()
-        generator.generate(invalid_cases, INVALID_OUTPUT_DIR, prefix="invalid")
-        
+        n_invalid = generator.generate(invalid_cases, INVALID_OUTPUT_DIR, prefix="invalid")
+
         # Generate Valid Cases
         valid_cases = get_valid_test_cases()
-        generator.generate(valid_cases, VALID_OUTPUT_DIR, prefix="valid")
-        
-        print("\nDone generating all test cases.")
-        
+        n_valid = generator.generate(valid_cases, VALID_OUTPUT_DIR, prefix="valid")
+
+        total = len(invalid_cases) + len(valid_cases)
+        print(f"\nDone: generated {n_invalid + n_valid} of {total} test cases.")
+
     except Exception as e:
         print(f"Fatal error: {e}")
 
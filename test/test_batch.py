@@ -0,0 +1,51 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from config import ConfigLoader
+
+ConfigLoader("config/config_dev.toml")
+
+from batch import BatchJob
+
+
+class TestBatchJob(unittest.TestCase):
+    """Smoke coverage for the batch entry point: construction compiles the
+    extraction XPaths and run() consumes a record stream end to end."""
+
+    @classmethod
+    def setUpClass(cls):
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        fixture = os.path.join(base_path, 'data/geonetwork/valid.xml')
+        with open(fixture, encoding='utf-8') as f:
+            cls.record_xml = f.read()
+
+    def _make_job(self, mock_state_store, records):
+        mock_state_store.return_value.get_watermark.return_value = None
+        connector = MagicMock()
+        connector.iter_records.return_value = iter(records)
+        connector.max_change_date = None
+        notifications = MagicMock()
+        return BatchJob(connector, notifications), notifications
+
+    @patch('batch.StateStore')
+    def test_construction(self, mock_state_store):
+        job, _ = self._make_job(mock_state_store, [])
+        self.assertFalse(job.connection_success)
+        self.assertFalse(job.stream_completed)
+
+    @patch('batch.StateStore')
+    def test_run_consumes_stream(self, mock_state_store):
+        job, notifications = self._make_job(mock_state_store, [self.record_xml])
+
+        job.run()
+
+        self.assertTrue(job.stream_completed)
+        self.assertTrue(job.connection_success)
+        notifications.notify_batch_summary.assert_called_once()
+        stats = notifications.notify_batch_summary.call_args[0][0]
+        self.assertEqual(stats.total_records, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,22 +6,26 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from validator.validator import GeoNetworkValidator
+from config import ConfigLoader
+
+# Load config and build the validator once at import; the dynamic test
+# generation below already runs at import time, and every generated test
+# shares the same rule set.
+ConfigLoader("config/config_dev.toml")
+_VALIDATOR = GeoNetworkValidator()
+
 
 class TestGeoNetworkValidatorXML(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        from config import ConfigLoader
-        ConfigLoader("config/config_dev.toml")
-        cls.validator = GeoNetworkValidator()
-        cls.base_path = os.path.dirname(os.path.abspath(__file__))
-        cls.valid_data_path = os.path.join(cls.base_path, 'data/geonetwork/generated_valid')
-        cls.invalid_data_path = os.path.join(cls.base_path, 'data/geonetwork/generated_invalid')
+    validator = _VALIDATOR
 
 def create_test_function(filepath, should_be_valid):
+    # Read the fixture once at collection time; every run of the test then
+    # validates the cached bytes instead of re-opening and re-reading the
+    # file (validate() accepts bytes directly).
+    with open(filepath, 'rb') as f:
+        xml_content = f.read()
+
     def test(self):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            xml_content = f.read()
-        
         result = self.validator.validate(xml_content)
         if should_be_valid:
             self.assertTrue(result.is_valid, f"File {os.path.basename(filepath)} should be valid but failed with errors: {result.errors}")
@@ -38,15 +42,15 @@ if os.path.exists(valid_data_path):
     for filename in os.listdir(valid_data_path):
         if filename.endswith(".xml"):
             test_name = f"test_valid_{filename.replace('.', '_').replace('-', '_')}"
-            test_func = create_test_function(os.path.join(valid_data_path, filename), True)
-            setattr(TestGeoNetworkValidatorXML, test_name, test_func)
+            setattr(TestGeoNetworkValidatorXML, test_name,
+                    create_test_function(os.path.join(valid_data_path, filename), True))
 
 if os.path.exists(invalid_data_path):
     for filename in os.listdir(invalid_data_path):
         if filename.endswith(".xml"):
             test_name = f"test_invalid_{filename.replace('.', '_').replace('-', '_')}"
-            test_func = create_test_function(os.path.join(invalid_data_path, filename), False)
-            setattr(TestGeoNetworkValidatorXML, test_name, test_func)
+            setattr(TestGeoNetworkValidatorXML, test_name,
+                    create_test_function(os.path.join(invalid_data_path, filename), False))
 
 if __name__ == '__main__':
     unittest.main()
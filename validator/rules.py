@@ -1,314 +1,324 @@
 from typing import Optional, List
-import xml.etree.ElementTree as ET
-from abc import ABC, abstractmethod
+from lxml import etree as ET
 import datetime
 import re
-from config import ConfigLoader
+import sys
+from functools import lru_cache
+from config import NAMESPACES
 
+# etree.XPath wants a plain dict, not the read-only proxy
+_XPATH_NS = dict(NAMESPACES)
+
+
+@lru_cache(maxsize=None)
+def _compile_xpath(expr: str) -> ET.XPath:
+    """Compile an XPath expression once; rules sharing a path share the
+    compiled object."""
+    return ET.XPath(expr, namespaces=_XPATH_NS)
+
+
+def _find_first(record: ET.Element, xp: ET.XPath) -> Optional[ET.Element]:
+    nodes = xp(record)
+    return nodes[0] if nodes else None
+
+
+# Most rule paths in the config anchor under the same identification
+# element. The validator locates that subtree once per record and hands
+# it to the rules, so each rule only descends the short tail instead of
+# repeating the full top-down walk.
+_IDENT_PREFIX = "mdb:identificationInfo/mri:MD_DataIdentification/"
+_XP_IDENT_ROOT = _compile_xpath(_IDENT_PREFIX.rstrip("/"))
+
+
+def _relative_to_identification(xpath: str) -> tuple:
+    """Return (tail, True) when xpath starts with the shared
+    identification prefix, (xpath, False) otherwise."""
+    if xpath.startswith(_IDENT_PREFIX):
+        return xpath[len(_IDENT_PREFIX):], True
+    return xpath, False
+
+
+def find_shared_subtree(record: ET.Element) -> Optional[ET.Element]:
+    """Locate the MD_DataIdentification element the prefixed rules are
+    evaluated against, or None if the record lacks one."""
+    return _find_first(record, _XP_IDENT_ROOT)
+
+
+# GRDC contract code, e.g. ABC1234-567-XYZ (the last dash is optional);
+# compiled once so ValidPurposeRule skips the re-cache lookup per record.
+_CONTRACT_CODE_RE = re.compile(r"^[A-Z]{3}[0-9]{4}-[0-9]{3}-?[A-Z]{3}$")
+
+def _is_valid_date(text: str) -> bool:
+    """Accept zero-padded YYYY-MM-DD or DD-MM-YYYY without strptime's
+    per-call format handling; datetime.date does the calendar range
+    check."""
+    if len(text) != 10 or not text.isascii():
+        return False
+    if text[4] == '-' and text[7] == '-':
+        y, m, d = text[0:4], text[5:7], text[8:10]
+    elif text[2] == '-' and text[5] == '-':
+        d, m, y = text[0:2], text[3:5], text[6:10]
+    else:
+        return False
+    # int() alone would let signs, underscores and whitespace through
+    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+        return False
+    try:
+        datetime.date(int(y), int(m), int(d))
+        return True
+    except ValueError:
+        return False
+
+# Decimal syntax accepted by FloatRule; matching up front keeps the
+# common valid case free of exception handling.
+_FLOAT_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+
+# Accepted link prefixes; the tuple form feeds a single C-level
+# startswith call. URLs subsume handles, and a DOI also counts as an
+# identifier.
+_URL_PREFIXES = ("http://", "https://")
+_IDENTIFIER_PREFIXES = ("10.",) + _URL_PREFIXES
+
+# Fixed sub-expressions used by the principal investigator rule. The
+# party predicate filters to principal investigators inside libxml2, so
+# the Python loop only ever sees PI parties.
+_PI_PARTY_PREDICATE = ("[cit:CI_Responsibility/cit:role/cit:CI_RoleCode"
+                       "/@codeListValue='principalInvestigator']")
+_XP_PI_NAME = _compile_xpath(".//cit:individual/cit:CI_Individual/cit:name/gco:CharacterString")
+_XP_PI_EMAIL = _compile_xpath(".//cit:electronicMailAddress/gco:CharacterString")
+_XP_ONLINE_RES = _compile_xpath(".//cit:onlineResource/cit:CI_OnlineResource")
+_XP_RES_NAME = _compile_xpath("cit:name/gco:CharacterString")
+_XP_RES_LINKAGE = _compile_xpath("cit:linkage/gco:CharacterString")
+
+
+class ValidationRule:
+    # uses_identification_subtree is True when the rule's compiled xpath
+    # is relative to the shared identification subtree rather than the
+    # record root; _bind_xpath sets it for every rule.
+    __slots__ = ("_xp", "_attr_name", "uses_identification_subtree")
+
+    def _bind_xpath(self, xpath: str) -> bool:
+        """Resolve the shared-prefix tail, split any trailing /@attr and
+        compile the element part. Returns True for attribute paths."""
+        tail, self.uses_identification_subtree = _relative_to_identification(xpath)
+        element_path, sep, self._attr_name = tail.partition("/@")
+        self._xp = _compile_xpath(element_path)
+        return bool(sep)
 
-class ValidationRule(ABC):
-    @abstractmethod
     def validate(self, record: ET.Element) -> Optional[str]:
         """Returns an error message if validation fails, None otherwise."""
-        pass
+        raise NotImplementedError
 
 
 class FieldExistsRule(ValidationRule):
+    __slots__ = ("xpath", "field_name", "validate")
+
     def __init__(self, xpath: str, field_name: str):
         self.xpath = xpath
         self.field_name = field_name
-
-    def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        if "/@" in self.xpath:
-            element_path, attr_name = self.xpath.split("/@")
-            node = record.find(element_path, namespaces)
-            if node is None:
-                return f"Record is missing a {self.field_name} (element not found)"
-            value = node.get(attr_name)
-            if not value or not value.strip():
-                return f"Record is missing a {self.field_name} (attribute {attr_name} missing or empty)"
+        # Decide the path shape once and bind validate to the matching
+        # specialised method, so per-record calls skip the string test
+        # and re-split.
+        if self._bind_xpath(xpath):
+            self.validate = self._validate_attribute
         else:
-            node = record.find(self.xpath, namespaces)
-            if node is None:
-                # Special handling for title to ensure we don't return None if it's really missing
-                if "title" in self.field_name.lower():
-                     return f"Record is missing a {self.field_name}"
-                return f"Record is missing a {self.field_name}"
-            
-            if not node.text or not node.text.strip():
-                 return f"Record is missing a {self.field_name}"
-                 
+            self.validate = self._validate_element
+
+    def _validate_element(self, record: ET.Element) -> Optional[str]:
+        node = _find_first(record, self._xp)
+        if node is None:
+            return f"Record is missing a {self.field_name}"
+        text = node.text
+        # isspace() checks emptiness without allocating a stripped copy
+        if not text or text.isspace():
+             return f"Record is missing a {self.field_name}"
+        return None
+
+    def _validate_attribute(self, record: ET.Element) -> Optional[str]:
+        node = _find_first(record, self._xp)
+        if node is None:
+            return f"Record is missing a {self.field_name} (element not found)"
+        value = node.get(self._attr_name)
+        if not value or value.isspace():
+            return f"Record is missing a {self.field_name} (attribute {self._attr_name} missing or empty)"
         return None
 
 
 class ValueInListRule(ValidationRule):
+    __slots__ = ("xpath", "allowed_values", "_allowed_display", "field_display_name", "validate")
+
     def __init__(self, xpath: str, allowed_values: List[str], field_display_name: str):
         self.xpath = xpath
-        self.allowed_values = allowed_values
+        # frozenset for O(1) membership; interning gives repeated values
+        # (classifications, licences) a pointer-equality fast path. The
+        # joined form is precomputed for error messages so they keep the
+        # config's ordering.
+        self.allowed_values = frozenset(sys.intern(v.strip()) for v in allowed_values)
+        self._allowed_display = ', '.join(allowed_values)
         self.field_display_name = field_display_name
-
-    def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        if "/@" in self.xpath:
-            element_path, attr_name = self.xpath.split("/@")
-            node = record.find(element_path, namespaces)
-            if node is None:
-                return f"Record is missing {self.field_display_name} (element not found)"
-            value = node.get(attr_name)
-            if not value:
-                return f"Record is missing {self.field_display_name} (attribute {attr_name} missing or empty)"
-            if value.strip() not in self.allowed_values:
-                return f"Record has an invalid {self.field_display_name}: '{value.strip()}'. Allowed values are: {', '.join(self.allowed_values)}"
+        if self._bind_xpath(xpath):
+            self.validate = self._validate_attribute
         else:
-            node = record.find(self.xpath, namespaces)
-            if node is None or not node.text:
-                return f"Record is missing {self.field_display_name}."
-            
-            if node.text.strip() not in self.allowed_values:
-                return f"Record has an invalid {self.field_display_name}: '{node.text.strip()}'. Allowed values are: {', '.join(self.allowed_values)}"
+            self.validate = self._validate_element
+
+    def _validate_element(self, record: ET.Element) -> Optional[str]:
+        node = _find_first(record, self._xp)
+        if node is None or not node.text:
+            return f"Record is missing {self.field_display_name}."
+        value = node.text.strip()
+        if value not in self.allowed_values:
+            return f"Record has an invalid {self.field_display_name}: '{value}'. Allowed values are: {self._allowed_display}"
+        return None
+
+    def _validate_attribute(self, record: ET.Element) -> Optional[str]:
+        node = _find_first(record, self._xp)
+        if node is None:
+            return f"Record is missing {self.field_display_name} (element not found)"
+        value = node.get(self._attr_name)
+        if not value:
+            return f"Record is missing {self.field_display_name} (attribute {self._attr_name} missing or empty)"
+        value = value.strip()
+        if value not in self.allowed_values:
+            return f"Record has an invalid {self.field_display_name}: '{value}'. Allowed values are: {self._allowed_display}"
         return None
 
 
 class FloatRule(ValidationRule):
+    __slots__ = ("xpath", "field_name")
+
     def __init__(self, xpath: str, field_name: str):
         self.xpath = xpath
         self.field_name = field_name
+        self._bind_xpath(xpath)
     
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text or not node.text.strip():
+        node = _find_first(record, self._xp)
+        text = node.text if node is not None else None
+        if not text or text.isspace():
              return f"Record is missing {self.field_name}"
-        try:
-            float(node.text.strip())
+        text = text.strip()
+        if _FLOAT_RE.match(text):
             return None
-        except ValueError:
-            return f"Record has an invalid float: {node.text.strip()}"
+        return f"Record has an invalid float: {text}"
 
 
 class DateRule(ValidationRule):
+    __slots__ = ("xpath", "field_name")
+
     def __init__(self, xpath: str, field_name: str):
         self.xpath = xpath
         self.field_name = field_name
+        self._bind_xpath(xpath)
     
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text or not node.text.strip():
-             return f"Record has an invalid date: {node.text.strip() if node is not None and node.text else 'None'}"
-        try:
-            # Try YYYY-MM-DD first
-            datetime.datetime.strptime(node.text.strip(), "%Y-%m-%d")
+        node = _find_first(record, self._xp)
+        raw = node.text if node is not None else None
+        if not raw or raw.isspace():
+             return f"Record has an invalid date: {raw.strip() if raw else 'None'}"
+        # Strip once; the format check and the error message reuse it
+        text = raw.strip()
+        if _is_valid_date(text):
             return None
-        except ValueError:
-            try:
-                # Try DD-MM-YYYY as fallback
-                datetime.datetime.strptime(node.text.strip(), "%d-%m-%Y")
-                return None
-            except ValueError:
-                return f"Record has an invalid date: {node.text.strip()}"
+        return f"Record has an invalid date: {text}"
 
 
 class ValidPurposeRule(ValidationRule):
+    __slots__ = ("xpath", "field_display_name")
+
     def __init__(self, xpath: str, field_display_name: str):
         self.xpath = xpath
         self.field_display_name = field_display_name
+        self._bind_xpath(xpath)
     
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text or not node.text.strip():
+        node = _find_first(record, self._xp)
+        if node is None or not node.text or node.text.isspace():
              return f"Record is missing {self.field_display_name}"
         # •	Purpose must be ‘GRDC contract code, project title’. Contract code is in format {A-Z}*3{0-9}*4-{0-9}*3-{A-Z}*3
-        try:
-            purpose = node.text.split(",")
-            if len(purpose) != 2:
-                return f"Record has an invalid {self.field_display_name}: {node.text.strip()}. It should be in the format 'GRDC contract code, project title'"
-            contract_code = purpose[0].strip()
-            if not re.match(r"^[A-Z]{3}[0-9]{4}-[0-9]{3}-?[A-Z]{3}$", contract_code):
-                return f"Record has an invalid contract code: {contract_code}. It should be in the format ABC1234-567-XYZ or ABC1234-567XYZ"
-            return None
-        except ValueError:
+        purpose = node.text.split(",")
+        if len(purpose) != 2:
             return f"Record has an invalid {self.field_display_name}: {node.text.strip()}. It should be in the format 'GRDC contract code, project title'"
+        contract_code = purpose[0].strip()
+        if not _CONTRACT_CODE_RE.match(contract_code):
+            return f"Record has an invalid contract code: {contract_code}. It should be in the format ABC1234-567-XYZ or ABC1234-567XYZ"
+        return None
 
 
 class IdentifierRule(ValidationRule):
+    __slots__ = ("xpath", "field_name")
+
     def __init__(self, xpath: str, field_name: str):
         self.xpath = xpath
         self.field_name = field_name
+        self._bind_xpath(xpath)
     
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text or not node.text.strip():
+        node = _find_first(record, self._xp)
+        if node is None or not node.text or node.text.isspace():
              return f"Record is missing {self.field_name}"
-        try:
-            # check for doi, handle or url
-            # check for doi, handle or url
-            doi_err = self._valid_doi(record)
-            if not doi_err:
-                return None
-            
-            handle_err = self._valid_handle(record)
-            if not handle_err:
-                return None
-
-            url_err = self._valid_url(record)
-            if not url_err:
-                return None
-            
-            return f"Record has an invalid identifier: {node.text.strip()}"
-        except ValueError:
-            return f"Record has an invalid identifier: {node.text.strip()}"
-    
-    def _valid_doi(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
+        # The identifier is valid when it looks like a DOI, a handle or a
+        # plain URL; handles start with http:// so the URL prefixes cover
+        # them, leaving one C-level startswith over the prefix tuple.
+        text = node.text.strip()
+        if text.startswith(_IDENTIFIER_PREFIXES):
             return None
-        try:
-            # check for doi prefix
-            if not node.text.startswith("10."):
-                return f"Record has an invalid doi: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid doi: {node.text.strip()}"
-
-    def _valid_handle(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for handle prefix
-            if not node.text.startswith("http://hdl.handle.net/"):
-                return f"Record has an invalid handle: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid handle: {node.text.strip()}"
-
-    def _valid_url(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for url prefix
-            if not node.text.startswith("http://") and not node.text.startswith("https://"):
-                return f"Record has an invalid url: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid url: {node.text.strip()}"
+        return f"Record has an invalid identifier: {text}"
 
 
 class CitationRule(ValidationRule):
+    __slots__ = ("xpath", "field_name")
+
     def __init__(self, xpath: str, field_name: str):
         self.xpath = xpath
         self.field_name = field_name
+        self._bind_xpath(xpath)
     
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
+        node = _find_first(record, self._xp)
         if node is None or not node.text:
             return None
-        try:
-            # check for citation prefix
-            if not node.text.startswith("http://") and not node.text.startswith("https://"):
-                return f"Record has an invalid citation: {node.text.strip()}"
-            return None
-        except ValueError:
+        # check for citation prefix
+        if not node.text.startswith(_URL_PREFIXES):
             return f"Record has an invalid citation: {node.text.strip()}"
-
-    def _valid_given_name(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for given name
-            if not node.text.strip():
-                return f"Record has an invalid given name: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid given name: {node.text.strip()}"
-    
-    def _valid_family_name(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for family name
-            if not node.text.strip():
-                return f"Record has an invalid family name: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid family name: {node.text.strip()}"
-    
-    def _valid_orcid(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for orcid prefix
-            if not node.text.startswith("http://orcid.org/"):
-                return f"Record has an invalid orcid: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid orcid: {node.text.strip()}"
-    
-    def _valid_role(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        node = record.find(self.xpath, namespaces)
-        if node is None or not node.text:
-            return None
-        try:
-            # check for role
-            if not node.text.strip():
-                return f"Record has an invalid role: {node.text.strip()}"
-            return None
-        except ValueError:
-            return f"Record has an invalid role: {node.text.strip()}"
+        return None
 
 
 class PrincipalInvestigatorRule(ValidationRule):
+    __slots__ = ("xpath", "field_display_name")
+
     def __init__(self, xpath: str, field_display_name: str):
         self.xpath = xpath
         self.field_display_name = field_display_name
+        # The predicate contains /@, so compile the filtered path here
+        # rather than through _bind_xpath's attribute split.
+        tail, self.uses_identification_subtree = _relative_to_identification(xpath)
+        self._attr_name = ""
+        self._xp = _compile_xpath(tail + _PI_PARTY_PREDICATE)
 
     def validate(self, record: ET.Element) -> Optional[str]:
-        namespaces = ConfigLoader().namespaces
-        parties = record.findall(self.xpath, namespaces)
-        pi_found = False
-        for party in parties:
-            role = party.find("cit:CI_Responsibility/cit:role/cit:CI_RoleCode", namespaces)
-            if role is not None and role.get('codeListValue') == 'principalInvestigator':
-                pi_found = True
-                
-                # Validate Name
-                name = party.find(".//cit:individual/cit:CI_Individual/cit:name/gco:CharacterString", namespaces)
-                if name is None or not name.text or not name.text.strip():
-                     return "Principal Investigator must have a name"
-                
-                # Validate Email
-                email = party.find(".//cit:electronicMailAddress/gco:CharacterString", namespaces)
-                if email is not None and email.text:
-                     if "@" not in email.text:
-                         return f"Principal Investigator has invalid email: {email.text}"
-                
-                # Validate Orcid
-                online_resources = party.findall(".//cit:onlineResource/cit:CI_OnlineResource", namespaces)
-                for res in online_resources:
-                    res_name = res.find("cit:name/gco:CharacterString", namespaces)
-                    if res_name is not None and res_name.text in ('Orcid', 'Orchid'):
-                        linkage = res.find("cit:linkage/gco:CharacterString", namespaces)
-                        if linkage is not None and linkage.text:
-                            if "orcid.org" not in linkage.text:
-                                return f"Principal Investigator has invalid ORCID URL: {linkage.text}"
-
-        if not pi_found:
-            return "Record must have at least one Principal Investigator"
-        
-        return None
\ No newline at end of file
+        for party in self._xp(record):
+            # Validate Name
+            name = _find_first(party, _XP_PI_NAME)
+            if name is None or not name.text or name.text.isspace():
+                 return "Principal Investigator must have a name"
+
+            # Validate Email
+            email = _find_first(party, _XP_PI_EMAIL)
+            if email is not None and email.text:
+                 if "@" not in email.text:
+                     return f"Principal Investigator has invalid email: {email.text}"
+
+            # Validate Orcid
+            online_resources = _XP_ONLINE_RES(party)
+            for res in online_resources:
+                res_name = _find_first(res, _XP_RES_NAME)
+                if res_name is not None and res_name.text in ('Orcid', 'Orchid'):
+                    linkage = _find_first(res, _XP_RES_LINKAGE)
+                    if linkage is not None and linkage.text:
+                        if "orcid.org" not in linkage.text:
+                            return f"Principal Investigator has invalid ORCID URL: {linkage.text}"
+
+            # This PI passed every check; the rule only requires one.
+            return None
+
+        return "Record must have at least one Principal Investigator"
\ No newline at end of file
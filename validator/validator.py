@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from dataclasses import dataclass
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from .rules import *
 from config import ConfigLoader
 
@@ -20,20 +20,35 @@ class GeoNetworkValidator(ValidatorInterface):
         self.validator_config = ConfigLoader().validator_config
         self.rules = []
         self._set_rules()
+        # One parser for the validator's lifetime: amortizes parser setup
+        # across records and hardens parsing (no entity expansion or
+        # network fetches for harvested payloads).
+        self._parser = ET.XMLParser(collect_ids=False, resolve_entities=False, no_network=True)
 
-    def validate(self, record_xml: str) -> ValidationResult:
+    def validate(self, record_xml) -> ValidationResult:
         errors = []
         try:
-            # Parse XML
-            root = ET.fromstring(record_xml)
-            
-            # Run all rules
-            for rule in self.rules:
-                error = rule.validate(root)
+            # Parse XML, unless the caller already supplies a parsed element
+            # (avoids parsing the same record twice in the batch pipeline)
+            if isinstance(record_xml, str):
+                root = ET.fromstring(record_xml.encode(), self._parser)
+            elif isinstance(record_xml, bytes):
+                root = ET.fromstring(record_xml, self._parser)
+            else:
+                root = record_xml
+
+            # Resolve the shared identification subtree once; rules whose
+            # paths anchor under it then skip the common descent.
+            subtree = find_shared_subtree(root)
+
+            # Run all rules via the pre-bound callables
+            for validate, uses_subtree in self._validators:
+                context = subtree if uses_subtree and subtree is not None else root
+                error = validate(context)
                 if error:
                     errors.append(error)
                     
-        except ET.ParseError as e:
+        except ET.XMLSyntaxError as e:
             errors.append(f"XML Parse Error: {str(e)}")
             return ValidationResult(is_valid=False, errors=errors)
             
@@ -58,3 +73,8 @@ class GeoNetworkValidator(ValidatorInterface):
             elif rule.type == "principal_investigator":
                 self.rules.append(PrincipalInvestigatorRule(rule.xpath, rule.field_display_name))
 
+        # Bind each rule's validate method and subtree flag once, so the
+        # per-record loop skips both attribute lookups.
+        self._validators = tuple(
+            (rule.validate, rule.uses_identification_subtree) for rule in self.rules)
+